@@ -1,3 +1,17 @@
 from .algoritmogenetico import AlgoritmoGenetico
-from .algoritmogenetico import Visualizador
-from .algoritmogenetico import Individuo
\ No newline at end of file
+from .algoritmogenetico import Individuo
+from .algoritmogenetico import AvaliadorParalelo
+from .algoritmogenetico import AvaliadorAssincrono
+from .algoritmogenetico import CacheResultados
+from .algoritmogenetico import Diversidade
+from .algoritmogenetico import Substituto
+from .algoritmogenetico import Checkpoint
+from .servidor import ServidorLocal
+
+
+def __getattr__(nome):
+    # Visualizador importa o matplotlib, carregado só quando pedido
+    if nome == 'Visualizador':
+        from .visualizador import Visualizador
+        return Visualizador
+    raise AttributeError(f'module {__name__!r} has no attribute {nome!r}')
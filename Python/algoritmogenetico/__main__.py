@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+from .cli import main
+
+# ---------------------------------------------------------------
+# MAIN
+
+if __name__ == '__main__':
+    main()
@@ -7,13 +7,27 @@
 # IMPORTS
 
 from .individuo import Individuo
-from .visualizador import Visualizador
-
+from .avaliador import AvaliadorParalelo, AvaliadorAssincrono
+from .cache import CacheResultados
+from .resultados import salvaVarredura, exportaCsv
+from .diversidade import Diversidade
+from .substituto import Substituto
+from .checkpoint import Checkpoint
+
+from collections import Counter
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Callable, TYPE_CHECKING
 from math import sin, fabs, pi, sqrt, floor
-from random import choices, random, randint, uniform, sample
-from numpy import average, linspace
-from pandas import DataFrame
+from pathlib import Path
+from random import (choices, random, randint, uniform, sample, seed,
+                    getstate, setstate)
+from numpy import average, linspace, array, empty, nan
+
+# Visualizador importa o matplotlib, carregado só quando usado
+if TYPE_CHECKING:
+    from .visualizador import Visualizador
 
 # ---------------------------------------------------------------
 # CLASSE
@@ -53,17 +67,61 @@ class AlgoritmoGenetico:
     n_bits: int = field(repr=False, default=4*8)
     ''' tamanho dos cromossomos da população '''
 
+    pop_unica: bool = field(repr=False, default=False)
+    ''' Guarda cada cromossomo uma única vez, com sua multiplicidade '''
+
+    # Paralelismo
+
+    n_workers: int = field(repr=False, default=0)
+    ''' Nº de processos para cálculo da aptidão (0 = serial) '''
+
+    tam_bloco: int = field(repr=False, default=0)
+    ''' Nº de indivíduos por bloco de avaliação (0 = automático) '''
+
+    avaliador_async: AvaliadorAssincrono | None = field(
+        repr=False,
+        default=None
+    )
+    ''' Avaliação via serviço externo, substitui _objetivo se presente '''
+
+    substituto: Substituto | None = field(repr=False, default=None)
+    ''' Modelo que pré-seleciona quem é avaliado de verdade '''
+
+    # Reprodutibilidade
+
+    semente: int | None = field(repr=False, default=None)
+    ''' Semente aleatória de executa_n (None = não reprodutível) '''
+
+    cache: CacheResultados | None = field(repr=False, default=None)
+    ''' Cache de executa_n, usado só com semente e sem avaliador_async '''
+
+    # Métricas por geração
+
+    registra_diversidade: bool = field(repr=False, default=True)
+    ''' Registra a diversidade da população a cada geração '''
+
+    # Tolerância a falhas
+
+    checkpoint: Checkpoint | None = field(repr=False, default=None)
+    ''' Grava o estado de executa periodicamente, ver retoma '''
+
     # Repositórios de métricas e medidas
 
     pop: list[Individuo] = field(repr=False, init=False, default_factory=list)
     ''' População atual de indivíduos '''
 
+    contagens: list[int] = field(repr=False, init=False, default_factory=list)
+    ''' Multiplicidade de cada indivíduo de pop (sempre 1 sem pop_unica) '''
+
     melhor_individuo: dict = field(repr=True, init=False, default_factory=dict)
     ''' Resultados do melhor indivíduo '''
 
     metricas: dict = field(repr=False, init=False, default_factory=dict)
     ''' Resultados do melhor indivíduo '''
 
+    replicas: dict = field(repr=False, init=False, default_factory=dict)
+    ''' Resultados brutos de cada repetição do último executa_n '''
+
     def __post_init__(self):
         # Métricas para varredura
         self.metricas = {
@@ -81,13 +139,39 @@ class AlgoritmoGenetico:
         self.apt_maxima = list()
         self.apt_minima = list()
         self.apt_best = list()
-        self._visual = Visualizador(self.conf)
+        self._visual = None
+
+        # Registros do modelo substituto
+        self.registro_substituto = list()
+
+        # Registros de diversidade
+        self.div_hamming = list()
+        self.div_unicos = list()
+        self.div_frequencias = list()
+        self._diversidade = Diversidade(self.n_bits)
+
+        # Avaliação paralela
+        self._avaliador = None
+        self._relatorio_avaliacao = dict()
 
     # Propriedades
 
     @property
-    def visual(self) -> Visualizador:
-        ''' Interface para visualizador '''
+    def relatorio_avaliacao(self) -> dict:
+        '''
+        Tempos do pool de avaliação, atualizados durante a execução
+        Depois que o pool fecha, fica o último resumo
+        '''
+        if self._avaliador is not None:
+            return self._avaliador.relatorio()
+        return self._relatorio_avaliacao
+
+    @property
+    def visual(self) -> 'Visualizador':
+        ''' Interface para visualizador, criado no primeiro uso '''
+        if self._visual is None:
+            from .visualizador import Visualizador
+            self._visual = Visualizador(self.conf)
         return self._visual
 
     # Métodos privados
@@ -108,6 +192,13 @@ class AlgoritmoGenetico:
         self.apt_maxima.clear()
         self.apt_minima.clear()
         self.apt_best.clear()
+        self.div_hamming.clear()
+        self.div_unicos.clear()
+        self.div_frequencias.clear()
+        self._diversidade = Diversidade(self.n_bits)
+        self.registro_substituto.clear()
+        if self.substituto is not None:
+            self.substituto.reinicia()
         self.melhor_individuo = {
             'aptidao': self.v_min,
             'geracao_encontrado': 0
@@ -118,6 +209,149 @@ class AlgoritmoGenetico:
         ''' Função objetivo, calcula a aptidão dos individuos '''
         return valor + fabs(sin(32*valor))
 
+    def _avalia(self,
+                individuos: list) -> list:
+        ''' Calcula a aptidão de todos os individuos da lista '''
+        valores = [i.valor for i in individuos]
+        if self.avaliador_async is not None:
+            return self.avaliador_async.avalia(valores)
+        if self._avaliador is not None:
+            return self._avaliador.avalia(valores)
+        return [self._objetivo(v) for v in valores]
+
+    def _avaliaGeracao(self) -> tuple[list, list]:
+        '''
+        Calcula a aptidão da população atual
+        Com modelo substituto, parte das aptidões é estimada
+        Retorna as aptidões e os índices avaliados de verdade
+        '''
+        todos = list(range(len(self.pop)))
+        if self.substituto is None:
+            return self._avalia(self.pop), todos
+
+        # Enquanto o modelo não tem dados, avalia todos
+        valores = [i.valor for i in self.pop]
+        if self.substituto.pronto:
+            aptidoes = self.substituto.prediz(valores)
+            reais = self.substituto.seleciona(aptidoes)
+        else:
+            aptidoes = [0.0]*len(valores)
+            reais = todos
+
+        # Avaliação real dos escolhidos
+        medidas = self._avalia([self.pop[i] for i in reais])
+        for i, a in zip(reais, medidas):
+            aptidoes[i] = a
+        self.substituto.registra([valores[i] for i in reais], medidas)
+        return aptidoes, reais
+
+    def _parametrosCache(self,
+                         n: int) -> dict:
+        ''' Tudo que determina o resultado de executa_n '''
+        parametros = {
+            'algoritmo': type(self).__qualname__,
+            'n_geracoes': int(self.n_geracoes),
+            'n_pop': float(self.n_pop),
+            'tx_crz': float(self.tx_crz),
+            'tx_mut': float(self.tx_mut),
+            'v_min': float(self.v_min),
+            'v_max': float(self.v_max),
+            'n_bits': int(self.n_bits),
+            'pop_unica': bool(self.pop_unica),
+            'n': int(n),
+            'semente': self.semente
+        }
+        if self.substituto is not None:
+            parametros['substituto'] = self.substituto.parametros()
+        return parametros
+
+    def _estado(self,
+                geracao: int) -> dict:
+        '''
+        Cópia do estado ao fim de uma geração, para checkpoint
+        Só cópias rasas: o que é copiado não é alterado depois
+        '''
+        sub = self.substituto
+        return {
+            'geracao': geracao,
+            'hiperparametros': {
+                'n_geracoes': int(self.n_geracoes),
+                'n_pop': float(self.n_pop),
+                'tx_crz': float(self.tx_crz),
+                'tx_mut': float(self.tx_mut),
+                'v_min': float(self.v_min),
+                'v_max': float(self.v_max),
+                'n_bits': int(self.n_bits),
+                'pop_unica': bool(self.pop_unica)
+            },
+            'cromossomos': [i.cromossomo for i in self.pop],
+            'valores_internos': [i._valor for i in self.pop],
+            'contagens': list(self.contagens),
+            'rng': getstate(),
+            'melhor_individuo': dict(self.melhor_individuo),
+            'apt_media': list(self.apt_media),
+            'apt_maxima': list(self.apt_maxima),
+            'apt_minima': list(self.apt_minima),
+            'apt_best': list(self.apt_best),
+            'div_hamming': list(self.div_hamming),
+            'div_unicos': list(self.div_unicos),
+            'div_frequencias': list(self.div_frequencias),
+            'registro_substituto': list(self.registro_substituto),
+            'substituto_x': [] if sub is None else sub.x,
+            'substituto_y': [] if sub is None else sub.y
+        }
+
+    def _restaura(self,
+                  estado: dict) -> None:
+        ''' Inverso de _estado '''
+        for nome, valor in estado['hiperparametros'].items():
+            self.__dict__[nome] = valor
+
+        self._limpaRegistros()
+        self.pop = list()
+        for cr, interno in zip(estado['cromossomos'],
+                               estado['valores_internos']):
+            ind = self._novoIndividuo(cr=cr)
+            ind._valor = interno
+            self.pop.append(ind)
+        self.contagens = estado['contagens']
+
+        self.melhor_individuo = estado['melhor_individuo']
+        for nome in ['apt_media', 'apt_maxima', 'apt_minima', 'apt_best',
+                     'div_hamming', 'div_unicos', 'div_frequencias',
+                     'registro_substituto']:
+            self.__dict__[nome].extend(estado[nome])
+        if self.substituto is not None:
+            self.substituto.x = estado['substituto_x']
+            self.substituto.y = estado['substituto_y']
+        setstate(estado['rng'])
+
+    @contextmanager
+    def _poolAvaliacao(self):
+        '''
+        Mantém um pool de avaliação ativo durante o bloco
+        Chamadas aninhadas reaproveitam o pool já existente
+        '''
+        if (
+            self.n_workers < 1
+            or self._avaliador is not None
+            or self.avaliador_async is not None
+        ):
+            yield
+            return
+
+        self._avaliador = AvaliadorParalelo(
+            objetivo=self._objetivo,
+            n_workers=self.n_workers,
+            tam_bloco=self.tam_bloco
+        )
+        try:
+            yield
+        finally:
+            self._relatorio_avaliacao = self._avaliador.relatorio()
+            self._avaliador.fecha()
+            self._avaliador = None
+
     def _selecao(self,
                  aptidoes: list) -> list:
         '''
@@ -128,13 +362,40 @@ class AlgoritmoGenetico:
             i = choices(self.pop, weights=aptidoes, k=2)
         return i
 
+    def _selecaoUnica(self,
+                      acumulado: list) -> list:
+        '''
+        Seleciona dois cromossomos distintos da população única
+        acumulado é a soma acumulada de aptidão x multiplicidade
+        Mesma regra de _selecao: nunca cruza um cromossomo consigo,
+        mesmo com cópias. Com um único cromossomo na população,
+        onde _selecao não teria saída, ele é o par de si mesmo
+        '''
+        if len(self.pop) == 1:
+            return [self.pop[0].cromossomo]*2
+        indices = range(len(self.pop))
+        i, j = choices(indices, cum_weights=acumulado, k=2)
+        while i == j:
+            i, j = choices(indices, cum_weights=acumulado, k=2)
+        return [self.pop[i].cromossomo, self.pop[j].cromossomo]
+
     def _cruzamento(self,
                     geradores: list) -> list:
         ''' Define o resultado o cruzamento de dois geradores '''
 
-        # salva os cromossomos originais
-        cr1 = geradores[0].cromossomo
-        cr2 = geradores[1].cromossomo
+        # Retorna uma lista com os novos individuos
+        return [
+            self._novoIndividuo(cr=cr)
+            for cr in self._cruzaCromossomos(
+                geradores[0].cromossomo,
+                geradores[1].cromossomo
+            )
+        ]
+
+    def _cruzaCromossomos(self,
+                          cr1: str,
+                          cr2: str) -> list:
+        ''' Cruzamento direto entre dois cromossomos '''
 
         # cria novos cromossomos
         cr_f1 = ''
@@ -169,11 +430,7 @@ class AlgoritmoGenetico:
                     cr_f1 += cr2[a:b]
                     cr_f2 += cr1[a:b]
 
-        # Retorna uma lista com os novos individuos
-        return [
-            self._novoIndividuo(cr=cr)
-            for cr in [cr_f1, cr_f2]
-        ]
+        return [cr_f1, cr_f2]
 
     def _mutacao(self,
                  individuos: list) -> None:
@@ -181,24 +438,111 @@ class AlgoritmoGenetico:
 
         # para cada individuo da lista
         for ind in individuos:
-            # checa probabilidade
-            if random() < self.tx_mut:
-                # escolhe um locus
-                locus = randint(0, self.n_bits-1)
-                cr = ind.cromossomo
-                if cr[locus] == '1':
-                    pos = '0'
-                else:
-                    pos = '1'
+            cr = self._mutaCromossomo(ind.cromossomo)
+            if cr != ind.cromossomo:
+                ind.cromossomo = cr
+
+    def _mutaCromossomo(self,
+                        cr: str) -> str:
+        ''' Mutação direta de um cromossomo '''
+
+        # checa probabilidade
+        if random() < self.tx_mut:
+            # escolhe um locus
+            locus = randint(0, self.n_bits-1)
+            if cr[locus] == '1':
+                pos = '0'
+            else:
+                pos = '1'
+
+            # troca valor
+            cr = pos.join([cr[:locus], cr[locus+1:]])
+        return cr
+
+    def _novaPop(self,
+                 aptidoes: list) -> None:
+        ''' Gera a nova população por seleção, cruzamento e mutação '''
+        nova_pop = list()
+
+        # Preencher nova população
+        while len(nova_pop) < self.n_pop:
+            # Seleciona geradores
+            geradores = self._selecao(aptidoes)
+
+            # Realiza cruzamento
+            descendentes = self._cruzamento(geradores)
+
+            # Causa mutação
+            self._mutacao(descendentes)
+
+            # Adiciona na lista
+            nova_pop.extend(descendentes)
+
+        # Se tem muitos indivíduos, mata
+        while len(nova_pop) > self.n_pop:
+            nova_pop.pop(randint(0, len(nova_pop)-1))
+
+        # Atualiza população
+        self.pop = nova_pop
+        self.contagens = [1]*len(nova_pop)
+
+    def _unifica(self,
+                 genomas: Counter) -> None:
+        '''
+        Atualiza a população única a partir da contagem de cromossomos
+        Indivíduos já existentes são reaproveitados
+        '''
+        existentes = {i.cromossomo: i for i in self.pop}
+        self.pop = [
+            existentes.get(cr) or self._novoIndividuo(cr=cr)
+            for cr in genomas
+        ]
+        self.contagens = list(genomas.values())
 
-                # troca valor
-                ind.cromossomo = pos.join([cr[:locus],cr[locus+1:]])
+    def _novaPopUnica(self,
+                      aptidoes: list) -> None:
+        '''
+        Gera a nova população única
+        Cruzamento e mutação operam nos cromossomos, e os
+        descendentes são agrupados pelo hash do cromossomo
+        Ainda são n_pop descendentes por geração, só a
+        avaliação depende do nº de cromossomos distintos
+        '''
+        # Roleta calculada uma vez por geração
+        acumulado = list(accumulate(
+            a*c for a, c in zip(aptidoes, self.contagens)
+        ))
+        genomas = Counter()
+        n = 0
+
+        # Preencher nova população
+        while n < self.n_pop:
+            geradores = self._selecaoUnica(acumulado)
+            for cr in self._cruzaCromossomos(*geradores):
+                genomas[self._mutaCromossomo(cr)] += 1
+                n += 1
+
+        # Se tem muitos indivíduos, mata
+        while n > self.n_pop:
+            cr, = choices(list(genomas), weights=list(genomas.values()))
+            genomas[cr] -= 1
+            if genomas[cr] == 0:
+                del genomas[cr]
+            n -= 1
+
+        self._unifica(genomas)
 
     # Métodos públicos
 
     def executa(self,
                 plot=True) -> None:
         ''' Executa o algoritmo com base nos hiperparametros e individuos '''
+        with self._poolAvaliacao():
+            self._executa(plot=plot)
+
+    def _executa(self,
+                 plot=True) -> None:
+        ''' Corpo de executa, supõe o pool de avaliação já preparado '''
 
         # Limpa tudo
         self._limpaRegistros()
@@ -206,7 +550,7 @@ class AlgoritmoGenetico:
         # Arruma pasta pra salvar imagens
         if plot:
             pasta = f'pop_{self.n_pop}_crz_{self.tx_crz}_mut_{self.tx_mut}'
-            self._visual.setPasta(pasta, remove=True)
+            self.visual.setPasta(pasta, remove=True)
 
         # População inicial aleatória
         self.pop = [self._novoIndividuo() for _ in range(int(self.n_pop))]
@@ -214,25 +558,65 @@ class AlgoritmoGenetico:
         # Só pra complicar a vida do algoritmo
         for i in self.pop:
             i.valor = uniform(0, pi/4)
+        self.contagens = [1]*len(self.pop)
 
-        # Loop de gerações
-        for geracao in range(1, self.n_geracoes+1):
+        # Agrupa cromossomos repetidos
+        if self.pop_unica:
+            genomas = Counter(i.cromossomo for i in self.pop)
+            self.pop = []
+            self._unifica(genomas)
+
+        self._geracoes(inicio=1, plot=plot)
+
+    def _geracoes(self,
+                  inicio: int,
+                  plot: bool) -> None:
+        ''' Loop de gerações, de inicio até n_geracoes '''
+        for geracao in range(inicio, self.n_geracoes+1):
             # Calcula aptidao de toda população
-            aptidoes = [self._objetivo(i.valor) for i in self.pop]
+            aptidoes, reais = self._avaliaGeracao()
 
-            # Registra o melhor individuo
-            if max(aptidoes) > self.melhor_individuo['aptidao']:
+            # Registra o melhor individuo, só entre avaliações reais
+            melhor = max(aptidoes[i] for i in reais)
+            if melhor > self.melhor_individuo['aptidao']:
                 self.melhor_individuo = {
                     # 'individuo':self.pop[aptidoes.index(max(aptidoes))],
-                    'aptidao': max(aptidoes),
+                    'aptidao': melhor,
                     'geracao_encontrado': geracao
                 }
 
-            # Registros para plotagem
-            self.apt_media.append(average(aptidoes))
+            # Avaliações poupadas pelo modelo substituto
+            if self.substituto is not None:
+                self.registro_substituto.append({
+                    'geracao': geracao,
+                    'reais': len(reais),
+                    'poupadas': len(self.pop) - len(reais),
+                    'melhor': self.melhor_individuo['aptidao']
+                })
+
+            # Registros para plotagem, só com avaliações reais:
+            # estimativas do substituto não entram nas estatísticas
+            medidas = [aptidoes[i] for i in reais]
+            self.apt_media.append(average(
+                medidas,
+                weights=(
+                    [self.contagens[i] for i in reais]
+                    if self.pop_unica else None
+                )
+            ))
+
+            # Diversidade, atualizada só com os cromossomos que mudaram
+            if self.registra_diversidade:
+                self._diversidade.substitui(
+                    [i.cromossomo for i in self.pop],
+                    self.contagens
+                )
+                self.div_hamming.append(self._diversidade.hamming_medio)
+                self.div_unicos.append(self._diversidade.n_unicos)
+                self.div_frequencias.append(self._diversidade.frequencias)
             if plot:
-                self.apt_maxima.append(max(aptidoes))
-                self.apt_minima.append(min(aptidoes))
+                self.apt_maxima.append(max(medidas))
+                self.apt_minima.append(min(medidas))
                 self.apt_best.append(self.melhor_individuo['aptidao'])
                 if (
                     geracao == 1
@@ -240,7 +624,7 @@ class AlgoritmoGenetico:
                     or geracao % 50 == 0
                     or geracao == self.n_geracoes
                 ):
-                    self._visual.cromossomos(
+                    self.visual.cromossomos(
                         v_min=self.v_min,
                         v_max=self.v_max,
                         objetivo=self._objetivo,
@@ -248,35 +632,24 @@ class AlgoritmoGenetico:
                         geracao=geracao
                     )
                     nome = f'cr_{str(geracao).zfill(3)}'
-                    self._visual.salvarImagem(nome)
+                    self.visual.salvarImagem(nome)
 
             # Nova população, descendentes
-            nova_pop = list()
+            if self.pop_unica:
+                self._novaPopUnica(aptidoes)
+            else:
+                self._novaPop(aptidoes)
 
-            # Preencher nova população
-            while len(nova_pop) < self.n_pop:
-                # Seleciona geradores
-                geradores = self._selecao(aptidoes)
+            # Fotografia do estado, gravada em segundo plano
+            if self.checkpoint is not None and self.checkpoint.devido(geracao):
+                self.checkpoint.grava(self._estado(geracao))
 
-                # Realiza cruzamento
-                descendentes = self._cruzamento(geradores)
-
-                # Causa mutação
-                self._mutacao(descendentes)
-
-                # Adiciona na lista
-                nova_pop.extend(descendentes)
-
-            # Se tem muitos indivíduos, mata
-            while len(nova_pop) > self.n_pop:
-                nova_pop.pop(randint(0, len(nova_pop)-1))
-
-            # Atualiza população
-            self.pop = nova_pop
+        if self.checkpoint is not None:
+            self.checkpoint.espera()
 
         if plot:
             # Linhas e áreas
-            self._visual.aptidao(
+            self.visual.aptidao(
                 self.apt_media,
                 self.apt_best,
                 self.apt_maxima,
@@ -284,42 +657,113 @@ class AlgoritmoGenetico:
             )
 
             # Salva imagem
-            self._visual.salvarImagem('aptidao')
+            self.visual.salvarImagem('aptidao')
+
+            if self.registra_diversidade:
+                self.visual.diversidade(
+                    self.div_hamming,
+                    self.div_unicos
+                )
+                self.visual.salvarImagem('diversidade')
+
+    def retoma(self,
+               checkpoint: Path | str,
+               plot: bool = False) -> None:
+        '''
+        Continua uma execução a partir de um checkpoint
+        O resultado é idêntico ao da execução sem interrupção,
+        desde que objetivo e substituto sejam os mesmos
+        '''
+        estado = Checkpoint.carrega(checkpoint)
+        self._restaura(estado)
+
+        if plot:
+            pasta = f'pop_{self.n_pop}_crz_{self.tx_crz}_mut_{self.tx_mut}'
+            self.visual.setPasta(pasta)
+
+        with self._poolAvaliacao():
+            self._geracoes(inicio=estado['geracao']+1, plot=plot)
 
     def executa_n(self,
                   n: int = 10,
                   plot: bool = True,
-                  label_params: list = []) -> None:
+                  label_params: list = [],
+                  ao_concluir: Callable | None = None) -> None:
         '''
         Executa o AG n vezes
         Armazena as métricas para varredura
         Atualiza a aptidão média de acordo
         Plota o gráfico
+
+        Com semente e cache definidos, resultados já calculados
+        são lidos do disco em vez de executados novamente. Com
+        avaliador_async o cache é ignorado, pois a chave não
+        identifica o serviço que calcula a aptidão
+
+        ao_concluir(i, melhor_individuo) é chamada ao fim de cada
+        repetição, inclusive as lidas do cache
         '''
-        apt_media = None
-        n_geracoes_otimo = []
-        otimo_apt = []
-        for _ in range(n):
-            # Executa o AG
-            self.executa(plot=False)
-
-            # Atualiza lista das métricas
-            n_geracoes_otimo.append(
-                self.melhor_individuo['geracao_encontrado']
-            )
-            otimo_apt.append(
-                self.melhor_individuo['aptidao']
-            )
+        # Procura no cache
+        chave = None
+        dados = None
+        if (
+            self.cache is not None
+            and self.semente is not None
+            and self.avaliador_async is None
+        ):
+            parametros = self._parametrosCache(n)
+            chave = self.cache.chave(parametros)
+            dados = self.cache.obtem(chave)
+
+        if dados is not None:
+            n_geracoes_otimo = dados['n_geracoes_otimo'].tolist()
+            otimo_apt = dados['otimo_apt'].tolist()
+            curvas = dados['apt_media'].tolist()
+            if ao_concluir is not None:
+                for i, (g, a) in enumerate(zip(n_geracoes_otimo, otimo_apt)):
+                    ao_concluir(i, {'aptidao': a, 'geracao_encontrado': g})
+        else:
+            if self.semente is not None:
+                seed(self.semente)
+
+            n_geracoes_otimo = []
+            otimo_apt = []
+            curvas = []
+            with self._poolAvaliacao():
+                for i in range(n):
+                    # Executa o AG
+                    self._executa(plot=False)
+
+                    # Atualiza lista das métricas
+                    n_geracoes_otimo.append(
+                        self.melhor_individuo['geracao_encontrado']
+                    )
+                    otimo_apt.append(
+                        self.melhor_individuo['aptidao']
+                    )
+                    curvas.append(list(self.apt_media))
+                    if ao_concluir is not None:
+                        ao_concluir(i, dict(self.melhor_individuo))
+
+            # Guarda no cache
+            if chave is not None:
+                self.cache.grava(
+                    chave,
+                    parametros,
+                    n_geracoes_otimo=array(n_geracoes_otimo),
+                    otimo_apt=array(otimo_apt),
+                    apt_media=array(curvas)
+                )
 
-            # Somatório da aptidao média
-            if plot:
-                if not apt_media:
-                    apt_media = self.apt_media
-                else:
-                    apt_media = [
-                        a+b
-                        for a, b in zip(apt_media, self.apt_media)
-                    ]
+        # Resultados brutos
+        self.replicas = {
+            'n_geracoes_otimo': n_geracoes_otimo,
+            'otimo_apt': otimo_apt,
+            'apt_media': curvas
+        }
+
+        # Somatório da aptidao média
+        apt_media = [sum(apts) for apts in zip(*curvas)]
 
         # Métricas
         self.metricas['n_geracoes_otimo'] = sum(n_geracoes_otimo)/n
@@ -332,7 +776,7 @@ class AlgoritmoGenetico:
                 label = ' | '.join(
                     [f'{p} : {self.__dict__[p]:g}' for p in label_params]
                 )
-            self._visual.plot_linha(
+            self.visual.plot_linha(
                 data=[x/n for x in apt_media],
                 label=label
             )
@@ -358,10 +802,11 @@ class AlgoritmoGenetico:
         )
 
         # Para cada amostra, executa n vezes
-        for amostra in param_a:
-            print(f"{amostra:g}, ", end='', flush=True)
-            self.__dict__[param] = amostra
-            self.executa_n(n=n, plot=True, label_params=[param])
+        with self._poolAvaliacao():
+            for amostra in param_a:
+                print(f"{amostra:g}, ", end='', flush=True)
+                self.__dict__[param] = amostra
+                self.executa_n(n=n, plot=True, label_params=[param])
         print('')
 
         # Salva o arquivo de imagem
@@ -371,18 +816,26 @@ class AlgoritmoGenetico:
             if p != param else ''
             for p in ['n_pop', 'tx_mut', 'tx_crz']
         ])
-        self._visual.setPasta(pasta, remove=True)
-        self._visual.setVarreduraUni(param)
-        self._visual.salvarImagem(pasta)
+        self.visual.setPasta(pasta, remove=True)
+        self.visual.setVarreduraUni(param)
+        self.visual.salvarImagem(pasta)
 
     def varredura_bidimensional(self,
                                 n: int = 10,
                                 param1: str = 'tx_mut',
-                                param2: str = 'tx_crz') -> None:
+                                param2: str = 'tx_crz',
+                                curvas: bool = False,
+                                comprimir: bool = True,
+                                csv: bool = False,
+                                nome: str = 'varredura') -> None:
         '''
         Busca o valor de métricas em um espaço bidimensional
         dos hiperparâmetros do AG e cria uma superfície
         para visualização
+
+        Todas as repetições de cada célula são salvas em formato
+        binário (ver resultados.py), junto das curvas de aptidão
+        média se curvas=True. O csv das médias é opcional
         '''
         assert(param1 in self.limites_varredura)
         assert(param1 in self.__dict__)
@@ -398,39 +851,43 @@ class AlgoritmoGenetico:
             for p in [param1, param2]
         )
 
-        # Tabelas para varredura
-        dfs = {
-            metrica: DataFrame(
-                index=param1_a,
-                columns=param2_a,
-                dtype=float
-            ) for metrica in self.metricas
+        # Arrays para varredura, uma entrada por repetição
+        forma = (len(param1_a), len(param2_a), n)
+        dados = {
+            'param1': array(param1),
+            'param2': array(param2),
+            'eixo1': param1_a,
+            'eixo2': param2_a,
+            **{metrica: empty(forma) for metrica in self.metricas}
         }
+        if curvas:
+            dados['apt_media'] = empty((*forma, self.n_geracoes))
+            dados['apt_media'].fill(nan)
 
         # Varredura dos eixos
-        for amostra1 in param1_a:
-            # Muda hiperparâmetro
-            print(f'{param1} : {amostra1:g}')
-            self.__dict__[param1] = amostra1
-            for amostra2 in param2_a:
+        with self._poolAvaliacao():
+            for i, amostra1 in enumerate(param1_a):
                 # Muda hiperparâmetro
-                print(f'|----{param2} : {amostra2:g}')
-                self.__dict__[param2] = amostra2
-
-                # Executa AG n vezes
-                self.executa_n(n=n, plot=False)
-
-                # Salva métricas na tabela
-                for metrica in dfs:
-                    dfs[metrica].loc[
-                        amostra1,
-                        amostra2
-                    ] = self.metricas[metrica]
-
-        for metrica in dfs:
-            file_path = self.conf['result_dir']/metrica
-            with open(file_path.with_suffix('.csv'), 'w') as file:
-                dfs[metrica].to_csv(
-                    file,
-                    float_format='%.6f'
-                )
+                print(f'{param1} : {amostra1:g}')
+                self.__dict__[param1] = amostra1
+                for j, amostra2 in enumerate(param2_a):
+                    # Muda hiperparâmetro
+                    print(f'|----{param2} : {amostra2:g}')
+                    self.__dict__[param2] = amostra2
+
+                    # Executa AG n vezes
+                    self.executa_n(n=n, plot=False)
+
+                    # Salva repetições na célula
+                    for metrica in self.metricas:
+                        dados[metrica][i, j] = self.replicas[metrica]
+                    if curvas:
+                        dados['apt_media'][i, j] = self.replicas['apt_media']
+
+        salvaVarredura(
+            self.conf['result_dir']/nome,
+            dados,
+            comprimir=comprimir
+        )
+        if csv:
+            exportaCsv(dados, self.conf['result_dir'])
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+import asyncio
+from math import ceil, inf
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from typing import Awaitable, Callable
+from numpy import ndarray, float64
+
+# ---------------------------------------------------------------
+# TRABALHADORES
+
+# Estado global de cada processo do pool
+_objetivo = None
+_buffers = dict()
+
+
+def _iniciaTrabalhador(objetivo: Callable) -> None:
+    ''' Recebe a função objetivo uma única vez, na criação do processo '''
+    global _objetivo
+    _objetivo = objetivo
+
+
+def _anexa(nomes: tuple) -> list:
+    ''' Anexa os buffers compartilhados ao processo, reaproveitando se possível '''
+    if nomes not in _buffers:
+        # Buffers antigos (pool redimensionado) são descartados
+        for shms, _ in _buffers.values():
+            for shm in shms:
+                shm.close()
+        _buffers.clear()
+        shms = [SharedMemory(name=nome) for nome in nomes]
+        _buffers[nomes] = (shms, [
+            ndarray((shm.size // 8,), dtype=float64, buffer=shm.buf)
+            for shm in shms
+        ])
+    return _buffers[nomes][1]
+
+
+def _avaliaBloco(tarefa: tuple) -> tuple:
+    ''' Avalia um bloco da população diretamente na memória compartilhada '''
+    nome_ent, nome_sai, ini, fim = tarefa
+    t0 = perf_counter()
+    entrada, saida = _anexa((nome_ent, nome_sai))
+    for i in range(ini, fim):
+        saida[i] = _objetivo(float(entrada[i]))
+    return ini, fim, perf_counter() - t0
+
+
+# ---------------------------------------------------------------
+# CLASSES
+
+
+class _Tempos:
+    '''
+    Tempos de avaliação acumulados durante a vida do avaliador
+
+    O histórico fica só em contagem, soma, mínimo e máximo, com
+    memória constante em varreduras longas. Os blocos da última
+    avaliação são guardados por inteiro
+    '''
+
+    def __init__(self):
+        self.n = 0
+        self.soma = 0.0
+        self.minimo = inf
+        self.maximo = 0.0
+        self.ultima = list()
+        ''' (início, fim, segundos) de cada bloco da última avaliação '''
+
+    def nova(self) -> None:
+        ''' Começa o registro de uma nova avaliação '''
+        self.ultima = list()
+
+    def registra(self,
+                 ini: int,
+                 fim: int,
+                 segundos: float) -> None:
+        ''' Inclui o tempo de um bloco '''
+        self.n += 1
+        self.soma += segundos
+        self.minimo = min(self.minimo, segundos)
+        self.maximo = max(self.maximo, segundos)
+        self.ultima.append((ini, fim, segundos))
+
+    def resumo(self) -> dict:
+        ''' Estatísticas acumuladas e blocos da última avaliação '''
+        if not self.n:
+            return {'n_blocos': 0}
+        return {
+            'n_blocos': self.n,
+            'tempo_total': self.soma,
+            'tempo_medio': self.soma/self.n,
+            'tempo_minimo': self.minimo,
+            'tempo_maximo': self.maximo,
+            'ultima_avaliacao': sorted(self.ultima)
+        }
+
+
+class AvaliadorParalelo:
+    '''
+    Pool persistente de processos para cálculo da aptidão
+
+    Os valores decodificados da população ficam em um buffer de
+    memória compartilhada e os processos escrevem as aptidões em
+    um segundo buffer. Só os índices de cada bloco trafegam entre
+    processos, nenhum Individuo é serializado
+    '''
+
+    def __init__(self,
+                 objetivo: Callable,
+                 n_workers: int,
+                 tam_bloco: int = 0):
+        self.n_workers = n_workers
+        self.tam_bloco = tam_bloco
+        self.tempos = _Tempos()
+        ''' Tempos dos blocos avaliados '''
+
+        self._capacidade = 0
+        self._shm = tuple()
+        self._entrada = None
+        self._saida = None
+
+        # Processos filhos compartilham o rastreador de recursos do pai
+        resource_tracker.ensure_running()
+        self._pool = Pool(
+            processes=n_workers,
+            initializer=_iniciaTrabalhador,
+            initargs=(objetivo,)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fecha()
+
+    def _reserva(self,
+                 n: int) -> None:
+        ''' Garante buffers compartilhados com espaço para n valores '''
+        if n <= self._capacidade:
+            return
+        self._liberaBuffers()
+        self._shm = tuple(
+            SharedMemory(create=True, size=8*n)
+            for _ in range(2)
+        )
+        self._entrada, self._saida = (
+            ndarray((n,), dtype=float64, buffer=shm.buf)
+            for shm in self._shm
+        )
+        self._capacidade = n
+
+    def _liberaBuffers(self) -> None:
+        ''' Fecha e remove os buffers compartilhados '''
+        # Vistas numpy precisam morrer antes do close
+        self._entrada = None
+        self._saida = None
+        for shm in self._shm:
+            shm.close()
+            shm.unlink()
+        self._shm = tuple()
+        self._capacidade = 0
+
+    def avalia(self,
+               valores: list) -> list:
+        ''' Calcula a aptidão de cada valor decodificado '''
+        n = len(valores)
+        self.tempos.nova()
+        if n == 0:
+            return []
+        self._reserva(n)
+        self._entrada[:n] = valores
+
+        # Divide a população em blocos
+        bloco = self.tam_bloco or ceil(n / self.n_workers)
+        nomes = tuple(shm.name for shm in self._shm)
+        tarefas = [
+            (*nomes, ini, min(ini + bloco, n))
+            for ini in range(0, n, bloco)
+        ]
+
+        # Cada bloco é escrito no lugar, só o tempo volta
+        for resultado in self._pool.imap_unordered(_avaliaBloco, tarefas):
+            self.tempos.registra(*resultado)
+
+        return self._saida[:n].tolist()
+
+    def relatorio(self) -> dict:
+        ''' Resumo dos tempos de avaliação por bloco '''
+        return self.tempos.resumo()
+
+    def fecha(self) -> None:
+        ''' Encerra os processos e libera a memória compartilhada '''
+        self._pool.close()
+        self._pool.join()
+        self._liberaBuffers()
+
+
+class AvaliadorAssincrono:
+    '''
+    Avaliação concorrente da aptidão via asyncio
+
+    Feita para funções objetivo servidas por outro processo (socket,
+    HTTP...). A corrotina objetivo recebe um lote de valores
+    decodificados e devolve a lista de aptidões na mesma ordem.
+    Todos os lotes de uma geração são enviados de uma vez, limitados
+    por max_concorrencia chamadas simultâneas
+    '''
+
+    def __init__(self,
+                 objetivo: Callable[[list], Awaitable[list]],
+                 max_concorrencia: int = 8,
+                 tam_lote: int = 1,
+                 timeout: float | None = None,
+                 tentativas: int = 3,
+                 espera: float = 0.0,
+                 repetir: tuple = (asyncio.TimeoutError, OSError)):
+        if tentativas < 1:
+            raise ValueError(f'tentativas deve ser >= 1, não {tentativas}')
+        if tam_lote < 1:
+            raise ValueError(f'tam_lote deve ser >= 1, não {tam_lote}')
+        if max_concorrencia < 1:
+            raise ValueError(
+                f'max_concorrencia deve ser >= 1, não {max_concorrencia}'
+            )
+        self.objetivo = objetivo
+        self.max_concorrencia = max_concorrencia
+        self.tam_lote = tam_lote
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera = espera
+        self.repetir = repetir
+
+        self.tempos = _Tempos()
+        ''' Tempos das chamadas bem sucedidas '''
+
+        self.n_falhas = 0
+        ''' Nº de chamadas repetidas por erro ou timeout '''
+
+        # Um único loop para todas as gerações
+        self._loop = asyncio.new_event_loop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fecha()
+
+    async def _avaliaLote(self,
+                          semaforo: asyncio.Semaphore,
+                          ini: int,
+                          lote: list) -> list:
+        ''' Avalia um lote, repetindo em caso de falha '''
+        async with semaforo:
+            for tentativa in range(1, self.tentativas+1):
+                t0 = perf_counter()
+                try:
+                    aptidoes = await asyncio.wait_for(
+                        self.objetivo(lote),
+                        timeout=self.timeout
+                    )
+                except self.repetir:
+                    if tentativa == self.tentativas:
+                        raise
+                    self.n_falhas += 1
+                    await asyncio.sleep(self.espera * tentativa)
+                    continue
+
+                # Resposta curta deslocaria as aptidões dos indivíduos
+                if len(aptidoes) != len(lote):
+                    raise ValueError(
+                        f'serviço devolveu {len(aptidoes)} aptidões '
+                        f'para um lote de {len(lote)} valores'
+                    )
+                self.tempos.registra(
+                    ini, ini + len(lote), perf_counter() - t0
+                )
+                return list(aptidoes)
+
+    async def _avaliaTodos(self,
+                           valores: list) -> list:
+        ''' Dispara todos os lotes da geração concorrentemente '''
+        semaforo = asyncio.Semaphore(self.max_concorrencia)
+        k = self.tam_lote
+        tarefas = [
+            asyncio.ensure_future(
+                self._avaliaLote(semaforo, ini, valores[ini:ini+k])
+            )
+            for ini in range(0, len(valores), k)
+        ]
+        try:
+            resultados = await asyncio.gather(*tarefas)
+        except BaseException:
+            # Lotes restantes não podem sobrar no loop para a
+            # próxima geração
+            for tarefa in tarefas:
+                tarefa.cancel()
+            await asyncio.gather(*tarefas, return_exceptions=True)
+            raise
+        return [a for lote in resultados for a in lote]
+
+    def avalia(self,
+               valores: list) -> list:
+        ''' Calcula a aptidão de cada valor decodificado '''
+        self.tempos.nova()
+        return self._loop.run_until_complete(self._avaliaTodos(valores))
+
+    def relatorio(self) -> dict:
+        ''' Resumo dos tempos de cada chamada ao serviço '''
+        return {
+            **self.tempos.resumo(),
+            'n_falhas': self.n_falhas
+        }
+
+    def fecha(self) -> None:
+        ''' Encerra o loop de eventos '''
+        self._loop.close()
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+from hashlib import sha256
+from json import dumps, loads
+from os import replace, stat_result, utime
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Callable
+from zipfile import BadZipFile
+from numpy import load, savez_compressed, array
+
+# ---------------------------------------------------------------
+# CONSTANTES
+
+VERSAO_MOTOR = '1'
+''' Mudou o algoritmo? Incremente para invalidar resultados antigos '''
+
+CORROMPIDO = (BadZipFile, KeyError, ValueError, EOFError)
+''' Erros de leitura de uma entrada truncada ou inválida '''
+
+# ---------------------------------------------------------------
+# CLASSE
+
+
+class CacheResultados:
+    '''
+    Cache em disco dos resultados de executa_n
+
+    Cada entrada é um arquivo .npz endereçado pelo hash dos
+    hiperparâmetros, do nº de repetições, da semente e da versão
+    do motor. O acesso atualiza a data do arquivo, e as entradas
+    menos usadas recentemente são removidas quando algum limite
+    é ultrapassado
+    '''
+
+    def __init__(self,
+                 pasta: Path,
+                 max_bytes: int = 256 * 2**20,
+                 max_entradas: int | None = None):
+        self.pasta = Path(pasta)
+        self.pasta.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entradas = max_entradas
+        self.acertos = 0
+        self.faltas = 0
+
+    # Métodos privados
+
+    def _caminho(self,
+                 chave: str) -> Path:
+        ''' Arquivo correspondente a uma chave '''
+        return self.pasta/f'{chave}.npz'
+
+    def _arquivos(self) -> list[tuple[Path, stat_result]]:
+        '''
+        Arquivos do cache e seus stat, do menos para o mais recente
+        Outro processo pode remover arquivos a qualquer momento,
+        os que sumirem durante a listagem são ignorados
+        '''
+        arquivos = list()
+        for caminho in self.pasta.glob('*.npz'):
+            try:
+                arquivos.append((caminho, caminho.stat()))
+            except FileNotFoundError:
+                continue
+        return sorted(arquivos, key=lambda a: a[1].st_mtime)
+
+    def _despeja(self) -> None:
+        ''' Remove entradas antigas até respeitar os limites '''
+        arquivos = self._arquivos()
+        total = sum(stat.st_size for _, stat in arquivos)
+        while arquivos and (
+            total > self.max_bytes
+            or (self.max_entradas is not None
+                and len(arquivos) > self.max_entradas)
+        ):
+            antigo, stat = arquivos.pop(0)
+            total -= stat.st_size
+            antigo.unlink(missing_ok=True)
+
+    # Métodos públicos
+
+    @staticmethod
+    def chave(parametros: dict) -> str:
+        ''' Hash estável de um dicionário de parâmetros '''
+        texto = dumps(
+            {**parametros, 'versao_motor': VERSAO_MOTOR},
+            sort_keys=True
+        )
+        return sha256(texto.encode('utf-8')).hexdigest()
+
+    def obtem(self,
+              chave: str) -> dict | None:
+        ''' Busca uma entrada, None se não existir '''
+        caminho = self._caminho(chave)
+        try:
+            with load(caminho) as arquivo:
+                dados = {
+                    k: arquivo[k]
+                    for k in arquivo.files
+                    if k != 'parametros'
+                }
+        except OSError:
+            # Inclui entrada inexistente ou despejada
+            self.faltas += 1
+            return None
+        except CORROMPIDO:
+            # Entrada ilegível é descartada e recalculada
+            caminho.unlink(missing_ok=True)
+            self.faltas += 1
+            return None
+
+        # Marca o acesso para a política de despejo, a entrada
+        # pode ter sido despejada por outro processo
+        try:
+            utime(caminho)
+        except FileNotFoundError:
+            pass
+        self.acertos += 1
+        return dados
+
+    def grava(self,
+              chave: str,
+              parametros: dict,
+              **dados) -> None:
+        ''' Grava uma entrada de forma atômica e aplica os limites '''
+        # Temporário com nome único, vários processos podem
+        # gravar a mesma chave ao mesmo tempo
+        with NamedTemporaryFile(dir=self.pasta,
+                                suffix='.tmp',
+                                delete=False) as arquivo:
+            temporario = Path(arquivo.name)
+            try:
+                savez_compressed(
+                    arquivo,
+                    parametros=array(dumps(parametros)),
+                    **dados
+                )
+            except BaseException:
+                arquivo.close()
+                temporario.unlink(missing_ok=True)
+                raise
+        try:
+            replace(temporario, self._caminho(chave))
+        except BaseException:
+            temporario.unlink(missing_ok=True)
+            raise
+        self._despeja()
+
+    def entradas(self) -> list[dict]:
+        '''
+        Lista as entradas, do menos para o mais recente
+        Entradas ilegíveis são removidas e não aparecem
+        '''
+        lista = list()
+        for caminho, stat in self._arquivos():
+            try:
+                with load(caminho) as arquivo:
+                    parametros = loads(str(arquivo['parametros']))
+            except OSError:
+                continue
+            except CORROMPIDO:
+                caminho.unlink(missing_ok=True)
+                continue
+            lista.append({
+                'chave': caminho.stem,
+                'bytes': stat.st_size,
+                'acesso': stat.st_mtime,
+                'parametros': parametros
+            })
+        return lista
+
+    def tamanho(self) -> int:
+        ''' Espaço ocupado em disco, em bytes '''
+        return sum(stat.st_size for _, stat in self._arquivos())
+
+    def remove(self,
+               chave: str) -> None:
+        ''' Remove uma entrada '''
+        self._caminho(chave).unlink(missing_ok=True)
+
+    def limpa(self,
+              filtro: Callable[[dict], bool] | None = None) -> int:
+        '''
+        Remove todas as entradas, ou só aquelas cujos
+        parâmetros satisfazem o filtro
+        Retorna o nº de entradas removidas
+        '''
+        removidas = 0
+        for entrada in self.entradas():
+            if filtro is None or filtro(entrada['parametros']):
+                self.remove(entrada['chave'])
+                removidas += 1
+        return removidas
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+from json import dumps, loads
+from math import isnan, nan
+from pathlib import Path
+from threading import Thread
+from time import monotonic
+from numpy import (array, float64, frombuffer, int64, load, packbits,
+                   savez, uint8, uint32, unpackbits)
+
+from .resultados import comSufixo
+
+# ---------------------------------------------------------------
+# FUNÇÕES
+
+
+def _codifica(estado: dict) -> dict:
+    ''' Converte o estado de uma execução em arrays compactos '''
+    n_bits = estado['hiperparametros']['n_bits']
+    texto = ''.join(estado['cromossomos']).encode('ascii')
+    bits = (frombuffer(texto, dtype=uint8) == ord('1')).reshape(-1, n_bits)
+    versao, interno, gauss = estado['rng']
+
+    meta = {
+        'geracao': estado['geracao'],
+        'hiperparametros': estado['hiperparametros'],
+        'melhor_individuo': estado['melhor_individuo'],
+        'registro_substituto': estado['registro_substituto'],
+        'rng_versao': versao,
+        'rng_gauss': nan if gauss is None else gauss
+    }
+    dados = {
+        'meta': array(dumps(meta)),
+        'cromossomos': packbits(bits, axis=1),
+        'valores_internos': array(estado['valores_internos'], dtype=float64),
+        'contagens': array(estado['contagens'], dtype=int64),
+        'rng_interno': array(interno, dtype=uint32),
+        'div_frequencias': array(estado['div_frequencias'], dtype=float64),
+        'div_unicos': array(estado['div_unicos'], dtype=int64)
+    }
+    for nome in ['apt_media', 'apt_maxima', 'apt_minima', 'apt_best',
+                 'div_hamming', 'substituto_x', 'substituto_y']:
+        dados[nome] = array(estado[nome], dtype=float64)
+    return dados
+
+
+def _decodifica(dados: dict) -> dict:
+    ''' Operação inversa de _codifica '''
+    meta = loads(str(dados['meta']))
+    n_bits = meta['hiperparametros']['n_bits']
+    bits = unpackbits(dados['cromossomos'], axis=1, count=n_bits)
+    cromossomos = [
+        linha.decode('ascii')
+        for linha in (bits + ord('0')).astype(uint8).view(f'S{n_bits}')[:, 0]
+    ]
+    gauss = meta['rng_gauss']
+
+    estado = {
+        'geracao': meta['geracao'],
+        'hiperparametros': meta['hiperparametros'],
+        'melhor_individuo': meta['melhor_individuo'],
+        'registro_substituto': meta['registro_substituto'],
+        'rng': (
+            meta['rng_versao'],
+            tuple(dados['rng_interno'].tolist()),
+            None if isnan(gauss) else gauss
+        ),
+        'cromossomos': cromossomos,
+        'div_frequencias': list(dados['div_frequencias'])
+    }
+    for nome in ['valores_internos', 'contagens', 'div_unicos',
+                 'apt_media', 'apt_maxima', 'apt_minima', 'apt_best',
+                 'div_hamming']:
+        estado[nome] = dados[nome].tolist()
+    estado['substituto_x'] = dados['substituto_x']
+    estado['substituto_y'] = dados['substituto_y']
+    return estado
+
+# ---------------------------------------------------------------
+# CLASSE
+
+
+class Checkpoint:
+    '''
+    Gravação periódica do estado de executa em disco
+
+    O AG entrega uma cópia do seu estado, e a conversão e a
+    escrita acontecem em uma thread separada. O arquivo é
+    escrito em um temporário e depois renomeado, então o
+    checkpoint no disco está sempre completo. Um erro de
+    escrita é guardado e relançado pela próxima espera
+    '''
+
+    def __init__(self,
+                 caminho: Path,
+                 a_cada_geracoes: int = 0,
+                 a_cada_segundos: float = 0.0):
+        self.caminho = comSufixo(caminho, '.npz')
+        self.a_cada_geracoes = a_cada_geracoes
+        ''' Intervalo em gerações (0 = desligado) '''
+        self.a_cada_segundos = a_cada_segundos
+        ''' Intervalo em segundos (0 = desligado) '''
+        self.n_gravados = 0
+        self._ultimo = monotonic()
+        self._thread = None
+        self._pendente = False
+        ''' Gravação devida adiada por outra ainda em andamento '''
+        self._erro = None
+        ''' Exceção da última escrita, relançada por espera '''
+
+    @property
+    def ocupado(self) -> bool:
+        ''' Ainda há uma gravação em andamento? '''
+        return self._thread is not None and self._thread.is_alive()
+
+    def devido(self,
+               geracao: int) -> bool:
+        '''
+        É hora de gravar?
+        Se a gravação anterior não terminou, a gravação devida fica
+        pendente e acontece na primeira geração com a thread livre
+        '''
+        por_geracao = (
+            self.a_cada_geracoes > 0
+            and geracao % self.a_cada_geracoes == 0
+        )
+        por_tempo = (
+            self.a_cada_segundos > 0
+            and monotonic() - self._ultimo >= self.a_cada_segundos
+        )
+        self._pendente = self._pendente or por_geracao or por_tempo
+        return self._pendente and not self.ocupado
+
+    def _escreve(self,
+                 estado: dict) -> None:
+        ''' Converte e grava o estado de forma atômica '''
+        try:
+            temporario = comSufixo(self.caminho, '.tmp')
+            with open(temporario, 'wb') as arquivo:
+                savez(arquivo, **_codifica(estado))
+            temporario.replace(self.caminho)
+            self.n_gravados += 1
+        except BaseException as erro:
+            # Exceções em threads se perdem, espera as relança
+            self._erro = erro
+
+    def grava(self,
+              estado: dict) -> None:
+        ''' Grava uma cópia do estado em segundo plano '''
+        self.espera()
+        self._pendente = False
+        self._ultimo = monotonic()
+        self._thread = Thread(target=self._escreve, args=(estado,))
+        self._thread.start()
+
+    def espera(self) -> None:
+        ''' Aguarda a gravação em andamento, relançando seu erro '''
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._erro is not None:
+            erro, self._erro = self._erro, None
+            raise erro
+
+    @staticmethod
+    def carrega(caminho: Path) -> dict:
+        ''' Lê um checkpoint gravado '''
+        with load(comSufixo(caminho, '.npz')) as arquivo:
+            return _decodifica({k: arquivo[k] for k in arquivo.files})
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+import sys
+from argparse import ArgumentParser, Namespace
+from itertools import product
+from json import dumps, load
+from pathlib import Path
+from random import seed
+from time import perf_counter
+from tomllib import load as load_toml
+from typing import TextIO
+from numpy import linspace
+
+from .algoritmogenetico import AlgoritmoGenetico
+from .cache import CacheResultados
+
+# ---------------------------------------------------------------
+# CONSTANTES
+
+HIPERPARAMETROS = {
+    'n_geracoes': int,
+    'n_pop': int,
+    'tx_crz': float,
+    'tx_mut': float,
+    'n_workers': int,
+    'tam_bloco': int,
+    'semente': int
+}
+''' Campos de AlgoritmoGenetico configuráveis pela linha de comando '''
+
+OPCOES = ('n', 'param', 'amostras', 'cache', 'saida')
+''' Opções dos subcomandos, também aceitas no arquivo de configuração '''
+
+TIPOS = {**HIPERPARAMETROS, 'n': int, 'amostras': int}
+''' Tipo de cada opção numérica, para conferir o arquivo de configuração '''
+
+# ---------------------------------------------------------------
+# FUNÇÕES
+
+# Execução em lote, sem gráficos
+#
+#     python -m algoritmogenetico run --n-pop 55 --semente 1
+#     python -m algoritmogenetico replicates -n 30 --config conf.toml
+#     python -m algoritmogenetico sweep -n 30 --param tx_mut --param n_pop
+#
+# Cada execução (ou célula da varredura) concluída gera uma
+# linha JSON na saída padrão, ou no arquivo de --saida
+
+
+def _argumentos() -> ArgumentParser:
+    ''' Define os subcomandos e suas opções '''
+    comum = ArgumentParser(add_help=False)
+    comum.add_argument('--config', type=Path,
+                       help='arquivo .json ou .toml com as opções')
+    comum.add_argument('--saida', type=str,
+                       help='arquivo JSON Lines (padrão: stdout)')
+    comum.add_argument('--cache', type=str,
+                       help='pasta do cache de resultados')
+    for nome, tipo in HIPERPARAMETROS.items():
+        comum.add_argument(f'--{nome.replace("_", "-")}',
+                           dest=nome, type=tipo)
+
+    parser = ArgumentParser(
+        prog='python -m algoritmogenetico',
+        description='Execução em lote do AG, com saída em JSON Lines'
+    )
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    sub.add_parser('run', parents=[comum],
+                   help='uma única execução')
+
+    replicas = sub.add_parser('replicates', parents=[comum],
+                              help='n execuções (executa_n)')
+    replicas.add_argument('-n', type=int, help='nº de repetições')
+
+    varredura = sub.add_parser('sweep', parents=[comum],
+                               help='varredura de 1 ou 2 hiperparâmetros')
+    varredura.add_argument('-n', type=int, help='nº de repetições')
+    varredura.add_argument('--param', action='append',
+                           help='hiperparâmetro varrido (até 2 vezes)')
+    varredura.add_argument('--amostras', type=int,
+                           help='nº de amostras por eixo')
+    return parser
+
+
+def _configuracao(args: Namespace) -> dict:
+    '''
+    Junta arquivo de configuração e argumentos
+    Argumentos da linha de comando têm prioridade
+    '''
+    conf = dict()
+    if args.config is not None:
+        if args.config.suffix == '.toml':
+            with open(args.config, 'rb') as arquivo:
+                conf = load_toml(arquivo)
+        else:
+            with open(args.config, encoding='utf-8') as arquivo:
+                conf = load(arquivo)
+
+    for nome in [*HIPERPARAMETROS, *OPCOES]:
+        valor = getattr(args, nome, None)
+        if valor is not None:
+            conf[nome] = valor
+    return conf
+
+
+def _converte(parser: ArgumentParser,
+              conf: dict) -> None:
+    '''
+    Converte as opções numéricas de conf para seus tipos
+    Valores inválidos do arquivo de configuração viram parser.error
+    '''
+    for nome, tipo in TIPOS.items():
+        if nome not in conf:
+            continue
+        try:
+            conf[nome] = tipo(conf[nome])
+        except (TypeError, ValueError):
+            parser.error(f'{nome}: esperado {tipo.__name__}, '
+                         f'recebido {conf[nome]!r}')
+
+
+def _validaParams(parser: ArgumentParser,
+                  conf: dict,
+                  ag: AlgoritmoGenetico) -> None:
+    ''' Confere e normaliza os hiperparâmetros varridos em conf '''
+    params = conf.get('param') or ['tx_mut']
+    if isinstance(params, str):
+        params = [params]
+    validos = ', '.join(ag.limites_varredura)
+    if not 1 <= len(params) <= 2:
+        parser.error(f'--param aceita 1 ou 2 hiperparâmetros '
+                     f'(recebidos {len(params)}): {validos}')
+    for p in params:
+        if p not in ag.limites_varredura:
+            parser.error(f'--param {p} inválido, '
+                         f'escolha entre: {validos}')
+    conf['param'] = list(params)
+
+
+def _algoritmo(conf: dict) -> AlgoritmoGenetico:
+    ''' Instancia o AG sem visualização '''
+    ag = AlgoritmoGenetico(**{
+        nome: conf[nome]
+        for nome in HIPERPARAMETROS
+        if nome in conf
+    })
+    if 'cache' in conf:
+        ag.cache = CacheResultados(conf['cache'])
+    return ag
+
+
+def _parametros(ag: AlgoritmoGenetico) -> dict:
+    ''' Hiperparâmetros atuais do AG '''
+    return {nome: getattr(ag, nome) for nome in HIPERPARAMETROS}
+
+
+def _escreve(saida: TextIO,
+             registro: dict) -> None:
+    ''' Uma linha JSON por registro, enviada imediatamente '''
+    saida.write(dumps(registro) + '\n')
+    saida.flush()
+
+
+def _run(ag: AlgoritmoGenetico,
+         conf: dict,
+         saida: TextIO) -> None:
+    ''' Uma execução do AG '''
+    if ag.semente is not None:
+        seed(ag.semente)
+    t0 = perf_counter()
+    ag.executa(plot=False)
+    _escreve(saida, {
+        'comando': 'run',
+        'parametros': _parametros(ag),
+        **ag.melhor_individuo,
+        'segundos': perf_counter() - t0
+    })
+
+
+def _replicates(ag: AlgoritmoGenetico,
+                conf: dict,
+                saida: TextIO) -> None:
+    ''' n execuções, uma linha por repetição '''
+    parametros = _parametros(ag)
+    ag.executa_n(
+        n=conf.get('n', 10),
+        plot=False,
+        ao_concluir=lambda i, melhor: _escreve(saida, {
+            'comando': 'replicates',
+            'parametros': parametros,
+            'replica': i,
+            **melhor
+        })
+    )
+
+
+def _sweep(ag: AlgoritmoGenetico,
+           conf: dict,
+           saida: TextIO) -> None:
+    ''' Varredura em grade, uma linha por célula '''
+    # Já validado e normalizado por _validaParams
+    params = conf['param']
+
+    n = conf.get('n', 10)
+    eixos = [
+        linspace(*ag.limites_varredura[p], conf.get('amostras', 11))
+        for p in params
+    ]
+
+    with ag._poolAvaliacao():
+        for amostras in product(*eixos):
+            for p, amostra in zip(params, amostras):
+                ag.__dict__[p] = amostra
+            t0 = perf_counter()
+            ag.executa_n(n=n, plot=False)
+            _escreve(saida, {
+                'comando': 'sweep',
+                'parametros': _parametros(ag),
+                'celula': dict(zip(params, amostras)),
+                **ag.metricas,
+                'replicas': {
+                    metrica: ag.replicas[metrica]
+                    for metrica in ag.metricas
+                },
+                'segundos': perf_counter() - t0
+            })
+
+
+def main(argv: list | None = None) -> None:
+    ''' Ponto de entrada de python -m algoritmogenetico '''
+    parser = _argumentos()
+    args = parser.parse_args(argv)
+    conf = _configuracao(args)
+    _converte(parser, conf)
+
+    # Sem semente as repetições não são reprodutíveis,
+    # e executa_n ignoraria o cache silenciosamente
+    if 'cache' in conf and 'semente' not in conf:
+        parser.error('--cache exige --semente')
+
+    ag = _algoritmo(conf)
+    if args.comando == 'sweep':
+        _validaParams(parser, conf, ag)
+
+    comandos = {
+        'run': _run,
+        'replicates': _replicates,
+        'sweep': _sweep
+    }
+    if 'saida' in conf:
+        with open(conf['saida'], 'a', encoding='utf-8') as saida:
+            comandos[args.comando](ag, conf, saida)
+    else:
+        comandos[args.comando](ag, conf, sys.stdout)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+from collections import Counter
+from numpy import frombuffer, int64, ndarray, uint8, zeros
+
+# ---------------------------------------------------------------
+# CLASSE
+
+
+class Diversidade:
+    '''
+    Métricas de diversidade da população a partir das
+    contagens de bits '1' em cada locus
+
+    Com c_j indivíduos com '1' no locus j, entre N indivíduos,
+    a soma das distâncias de Hamming entre todos os pares é
+    sum(c_j * (N - c_j)), sem precisar comparar pares. As
+    contagens são atualizadas só com os cromossomos que
+    entraram ou saíram da população
+    '''
+
+    def __init__(self,
+                 n_bits: int):
+        self.n_bits = n_bits
+        self.n = 0
+        self.contagens = zeros(n_bits, dtype=int64)
+        ''' Nº de indivíduos com '1' em cada locus '''
+        self.genomas = Counter()
+        ''' Multiplicidade de cada cromossomo na população '''
+
+    def _bits(self,
+              cromossomos: list) -> ndarray:
+        ''' Matriz booleana (n, n_bits), True onde o alelo é '1' '''
+        texto = ''.join(cromossomos).encode('ascii')
+        bits = frombuffer(texto, dtype=uint8) == ord('1')
+        return bits.reshape(-1, self.n_bits)
+
+    def adiciona(self,
+                 cromossomos: list) -> None:
+        ''' Inclui cromossomos na população '''
+        if cromossomos:
+            self.contagens += self._bits(cromossomos).sum(axis=0)
+            self.genomas.update(cromossomos)
+            self.n += len(cromossomos)
+
+    def remove(self,
+               cromossomos: list) -> None:
+        ''' Retira cromossomos da população '''
+        if cromossomos:
+            self.contagens -= self._bits(cromossomos).sum(axis=0)
+            self.genomas.subtract(cromossomos)
+            self.genomas = +self.genomas
+            self.n -= len(cromossomos)
+
+    def substitui(self,
+                  cromossomos: list,
+                  contagens: list | None = None) -> None:
+        '''
+        Troca a população pela nova lista de cromossomos,
+        opcionalmente com a multiplicidade de cada um
+        Só a diferença entre as duas é processada
+        '''
+        if contagens is None:
+            contagens = [1]*len(cromossomos)
+        nova = Counter()
+        for cr, c in zip(cromossomos, contagens):
+            nova[cr] += c
+        saem = self.genomas - nova
+        entram = nova - self.genomas
+        self.remove(list(saem.elements()))
+        self.adiciona(list(entram.elements()))
+
+    @property
+    def frequencias(self) -> ndarray:
+        ''' Frequência do alelo '1' em cada locus '''
+        return self.contagens / max(self.n, 1)
+
+    @property
+    def hamming_medio(self) -> float:
+        ''' Distância de Hamming média entre pares de indivíduos '''
+        if self.n < 2:
+            return 0.0
+        soma = int((self.contagens * (self.n - self.contagens)).sum())
+        return soma / (self.n * (self.n - 1) / 2)
+
+    @property
+    def n_unicos(self) -> int:
+        ''' Nº de cromossomos distintos '''
+        return len(self.genomas)
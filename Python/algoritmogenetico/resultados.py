@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+from pathlib import Path
+from shutil import rmtree
+from numpy import array, load, save, savez_compressed, ndarray
+
+# ---------------------------------------------------------------
+# CONSTANTES
+
+METRICAS = ('n_geracoes_otimo', 'otimo_apt')
+''' Métricas registradas por repetição em cada célula '''
+
+# ---------------------------------------------------------------
+# FUNÇÕES
+
+
+def comSufixo(caminho: Path,
+              sufixo: str) -> Path:
+    '''
+    Acrescenta o sufixo ao nome, se ainda não o tiver
+    Diferente de with_suffix, preserva pontos do nome,
+    como em varredura_mut_0.03
+    '''
+    caminho = Path(caminho)
+    if caminho.suffix == sufixo:
+        return caminho
+    return caminho.with_name(caminho.name + sufixo)
+
+# Formato de uma varredura bidimensional
+#
+# param1, param2      nomes dos hiperparâmetros (str)
+# eixo1, eixo2        valores amostrados de cada hiperparâmetro
+# n_geracoes_otimo    (len(eixo1), len(eixo2), n) por repetição
+# otimo_apt           (len(eixo1), len(eixo2), n) por repetição
+# apt_media           (len(eixo1), len(eixo2), n, n_geracoes), opcional
+#
+# Comprimido, tudo vai em um único .npz. Sem compressão, cada
+# array vira um .npy dentro de uma pasta, que pode ser lido
+# com memmap sem carregar tudo na memória
+
+
+def salvaVarredura(caminho: Path,
+                   dados: dict,
+                   comprimir: bool = True) -> Path:
+    ''' Salva uma varredura, retorna o caminho criado '''
+    caminho = Path(caminho)
+    pasta = caminho
+    arquivo_npz = comSufixo(caminho, '.npz')
+    if comprimir:
+        temporario = comSufixo(arquivo_npz, '.tmp')
+        with open(temporario, 'wb') as arquivo:
+            savez_compressed(arquivo, **dados)
+        temporario.replace(arquivo_npz)
+
+        # Versão sem compressão antiga teria prioridade na leitura
+        if pasta.is_dir():
+            rmtree(pasta)
+        return arquivo_npz
+
+    # Pasta nova montada ao lado e trocada no final, para
+    # não misturar arrays de varreduras diferentes
+    temporario = pasta.with_name(pasta.name + '_tmp')
+    if temporario.is_dir():
+        rmtree(temporario)
+    temporario.mkdir(parents=True)
+    for nome, valor in dados.items():
+        save(temporario/f'{nome}.npy', array(valor))
+
+    if pasta.is_dir():
+        antiga = pasta.with_name(pasta.name + '_old')
+        if antiga.is_dir():
+            rmtree(antiga)
+        pasta.rename(antiga)
+        temporario.rename(pasta)
+        rmtree(antiga)
+    else:
+        temporario.rename(pasta)
+    arquivo_npz.unlink(missing_ok=True)
+    return pasta
+
+
+def carregaVarredura(caminho: Path,
+                     mmap: bool = True) -> dict[str, ndarray]:
+    '''
+    Lê uma varredura salva por salvaVarredura
+    Aceita tanto o .npz quanto a pasta de .npy
+    '''
+    caminho = Path(caminho)
+    if caminho.is_dir():
+        return {
+            arquivo.stem: load(arquivo, mmap_mode='r' if mmap else None)
+            for arquivo in caminho.glob('*.npy')
+        }
+    with load(comSufixo(caminho, '.npz')) as arquivo:
+        return {k: arquivo[k] for k in arquivo.files}
+
+
+def exportaCsv(dados: dict,
+               pasta: Path) -> None:
+    '''
+    Exporta a média das repetições de cada métrica
+    para um csv, no formato tabela param1 x param2
+    '''
+    # pandas só é necessário aqui
+    from pandas import DataFrame
+
+    for metrica in METRICAS:
+        df = DataFrame(
+            dados[metrica].mean(axis=-1),
+            index=dados['eixo1'],
+            columns=dados['eixo2'],
+            dtype=float
+        )
+        file_path = Path(pasta)/metrica
+        with open(file_path.with_suffix('.csv'), 'w') as file:
+            df.to_csv(file, float_format='%.6f')
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+import asyncio
+from json import dumps, loads
+from math import fabs, sin
+from threading import Event, Thread
+from typing import Callable
+
+# ---------------------------------------------------------------
+# FUNÇÕES
+
+
+def aptidao(valor: float) -> float:
+    ''' Função do estudo de caso, g(y) = y + |sen(32y)| '''
+    return valor + fabs(sin(32*valor))
+
+# ---------------------------------------------------------------
+# CLASSE
+
+# Serviço de aptidão de mentira, para exercitar o AvaliadorAssincrono
+#
+#     with ServidorLocal(falhas=2, lentas=2, atraso=1.0) as servidor:
+#         ag.avaliador_async = AvaliadorAssincrono(
+#             servidor.objetivo, tam_lote=8, timeout=0.5
+#         )
+#         ag.executa(plot=False)
+#
+# Protocolo: uma conexão por lote, uma linha JSON com a lista de
+# valores na ida e uma linha JSON com a lista de aptidões na volta
+
+
+class ServidorLocal:
+    '''
+    Servidor asyncio local que responde g(y) para cada valor
+
+    Roda em uma thread própria, com seu próprio loop, e pode ser
+    usado de dentro do loop do AvaliadorAssincrono. As primeiras
+    `falhas` requisições são encerradas sem resposta (erro de
+    conexão) e as `lentas` seguintes só respondem após `atraso`
+    segundos (timeout), para testar as novas tentativas
+    '''
+
+    def __init__(self,
+                 objetivo: Callable[[float], float] = aptidao,
+                 falhas: int = 0,
+                 lentas: int = 0,
+                 atraso: float = 1.0,
+                 host: str = '127.0.0.1'):
+        self.funcao = objetivo
+        self.falhas = falhas
+        self.lentas = lentas
+        self.atraso = atraso
+        self.host = host
+        self.porta = None
+        ''' Porta escolhida pelo sistema ao iniciar '''
+        self.n_requisicoes = 0
+        ''' Nº de lotes recebidos, inclusive os que falharam '''
+
+        self._loop = None
+        self._servidor = None
+        self._thread = None
+
+    def __enter__(self):
+        self.inicia()
+        return self
+
+    def __exit__(self, *args):
+        self.fecha()
+
+    async def _atende(self,
+                      leitor: asyncio.StreamReader,
+                      escritor: asyncio.StreamWriter) -> None:
+        ''' Responde um lote, ou simula uma falha '''
+        self.n_requisicoes += 1
+        ordem = self.n_requisicoes
+        try:
+            valores = loads(await leitor.readline())
+            if ordem <= self.falhas:
+                return
+            if ordem <= self.falhas + self.lentas:
+                await asyncio.sleep(self.atraso)
+            resposta = [self.funcao(v) for v in valores]
+            escritor.write(dumps(resposta).encode('utf-8') + b'\n')
+            await escritor.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # Cliente desistiu por timeout
+            pass
+        finally:
+            escritor.close()
+
+    def _executa(self,
+                 pronto: Event) -> None:
+        ''' Loop do servidor, na thread própria '''
+        asyncio.set_event_loop(self._loop)
+        self._servidor = self._loop.run_until_complete(
+            asyncio.start_server(self._atende, self.host, 0)
+        )
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+        pronto.set()
+        self._loop.run_forever()
+
+    def inicia(self) -> None:
+        ''' Sobe o servidor e espera a porta estar disponível '''
+        self._loop = asyncio.new_event_loop()
+        pronto = Event()
+        self._thread = Thread(target=self._executa, args=(pronto,),
+                              daemon=True)
+        self._thread.start()
+        pronto.wait()
+
+    def fecha(self) -> None:
+        ''' Derruba o servidor e encerra a thread '''
+        async def encerra():
+            self._servidor.close()
+            # Respostas lentas ainda pendentes são abandonadas
+            atual = asyncio.current_task()
+            pendentes = [t for t in asyncio.all_tasks() if t is not atual]
+            for tarefa in pendentes:
+                tarefa.cancel()
+            await asyncio.gather(*pendentes, return_exceptions=True)
+            await self._servidor.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(encerra(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def objetivo(self,
+                       lote: list) -> list:
+        ''' Cliente: envia um lote e espera as aptidões '''
+        leitor, escritor = await asyncio.open_connection(
+            self.host, self.porta
+        )
+        try:
+            escritor.write(dumps(lote).encode('utf-8') + b'\n')
+            await escritor.drain()
+            linha = await leitor.readline()
+        finally:
+            escritor.close()
+        if not linha:
+            raise ConnectionResetError('conexão encerrada sem resposta')
+        return loads(linha)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Autor: Sergio P
+# Data: 19/10/2026
+
+# ---------------------------------------------------------------
+# IMPORTS
+
+from math import ceil
+from random import sample
+from numpy import (absolute, arange, argsort, array, clip, concatenate,
+                   float64, inf, searchsorted, take_along_axis, unique)
+
+# ---------------------------------------------------------------
+# CLASSE
+
+
+class Substituto:
+    '''
+    Modelo substituto barato para pré-seleção dos descendentes
+
+    Guarda os pares (valor decodificado, aptidão) já avaliados
+    e estima a aptidão de novos valores pela média dos k vizinhos
+    mais próximos. A cada geração só a fração mais promissora,
+    mais uma parcela aleatória de exploração, vai para a função
+    objetivo real
+    '''
+
+    def __init__(self,
+                 k: int = 5,
+                 fracao: float = 0.3,
+                 exploracao: float = 0.1,
+                 min_amostras: int = 50):
+        if not 0 < fracao <= 1:
+            raise ValueError(f'fracao deve estar em (0, 1], não {fracao}')
+        if not 0 <= exploracao <= 1:
+            raise ValueError(
+                f'exploracao deve estar em [0, 1], não {exploracao}'
+            )
+        self.k = k
+        ''' Nº de vizinhos da estimativa '''
+        self.fracao = fracao
+        ''' Fração mais promissora avaliada de verdade '''
+        self.exploracao = exploracao
+        ''' Fração aleatória do restante avaliada de verdade '''
+        self.min_amostras = min_amostras
+        ''' Abaixo disso, tudo é avaliado de verdade '''
+        self.reinicia()
+
+    def reinicia(self) -> None:
+        ''' Esquece as avaliações anteriores '''
+        self.x = array([], dtype=float64)
+        self.y = array([], dtype=float64)
+
+    def parametros(self) -> dict:
+        ''' Configuração do modelo, para o cache '''
+        return {
+            'k': self.k,
+            'fracao': self.fracao,
+            'exploracao': self.exploracao,
+            'min_amostras': self.min_amostras
+        }
+
+    def registra(self,
+                 valores: list,
+                 aptidoes: list) -> None:
+        ''' Inclui avaliações reais, mantendo os valores ordenados '''
+        x = concatenate([self.x, array(valores, dtype=float64)])
+        y = concatenate([self.y, array(aptidoes, dtype=float64)])
+        # Valores repetidos ficam com uma só entrada
+        self.x, indices = unique(x, return_index=True)
+        self.y = y[indices]
+
+    def prediz(self,
+               valores: list) -> list:
+        ''' Média das aptidões dos k vizinhos mais próximos '''
+        v = array(valores, dtype=float64)
+        k = min(self.k, len(self.x))
+
+        # Candidatos: k de cada lado da posição de inserção
+        pos = searchsorted(self.x, v)
+        janela = pos[:, None] + arange(-k, k)
+        fora = (janela < 0) | (janela >= len(self.x))
+        janela = clip(janela, 0, len(self.x) - 1)
+
+        # Os k candidatos mais próximos de cada valor
+        distancias = absolute(self.x[janela] - v[:, None])
+        distancias[fora] = inf
+        mais_proximos = argsort(distancias, axis=1, kind='stable')[:, :k]
+        vizinhos = take_along_axis(janela, mais_proximos, axis=1)
+        return self.y[vizinhos].mean(axis=1).tolist()
+
+    def seleciona(self,
+                  estimativas: list) -> list:
+        '''
+        Índices que devem ser avaliados de verdade: os mais
+        promissores segundo as estimativas, mais uma amostra
+        aleatória dos demais
+        Com n > 0, ao menos um índice é sempre escolhido
+        '''
+        n = len(estimativas)
+        ordem = sorted(range(n), key=lambda i: -estimativas[i])
+        n_melhores = min(n, max(1, ceil(self.fracao * n)))
+        resto = ordem[n_melhores:]
+        n_exploracao = min(len(resto), ceil(self.exploracao * n))
+        return sorted(ordem[:n_melhores] + sample(resto, n_exploracao))
+
+    @property
+    def pronto(self) -> bool:
+        ''' Já há avaliações suficientes para estimar? '''
+        return len(self.x) >= self.min_amostras
@@ -9,12 +9,13 @@
 
 import matplotlib.pyplot as plt
 from mpl_toolkits import mplot3d  # necessário!
-from pandas import read_csv
-from numpy import arange, linspace, array, meshgrid
+from numpy import arange, linspace, meshgrid, mean
 from shutil import rmtree
 from time import sleep
 from typing import Callable
 
+from .resultados import carregaVarredura
+
 # ---------------------------------------------------------------
 # CLASSE
 
@@ -52,34 +53,32 @@ class Visualizador:
 
     def superficie_varredura(self,
                              metrica: str,
-                             show=True) -> None:
+                             show=True,
+                             nome: str = 'varredura',
+                             estatistica: Callable = mean) -> None:
         ''' 
         Plota um objeto 3d para visualização da superfície de varredura
-        armazenada em memória
+        armazenada em disco
+
+        estatistica reduz as repetições de cada célula, recebendo
+        o array e axis=-1 (mean, median, std...)
         '''
 
         opt = 4.09299358937553  # Wolfram Alpha
 
         # Procura dados
-        file_path = self.conf['result_dir']/metrica
-        with open(file_path.with_suffix('.csv'), 'r') as file:
-            df = read_csv(
-                file,
-                index_col=0,
-                dtype=float
-            )
-        df.index = df.index.astype("float")
-        df.columns = df.columns.astype("float")
+        dados = carregaVarredura(self.conf['result_dir']/nome)
+        eixo1, eixo2 = dados['eixo1'], dados['eixo2']
 
         # Criação da figura
         fig = plt.figure()
         ax = plt.axes(projection='3d')
 
         # Eixos de plotagem
-        x, y = meshgrid(arange(len(df.columns)), arange(len(df.index)))
+        x, y = meshgrid(arange(len(eixo2)), arange(len(eixo1)))
 
         # Dados para plot no eizo z
-        z = array([[df[c][i] for c in df.columns] for i in df.index])
+        z = estatistica(dados[metrica], axis=-1)
 
         # Se é aptidão ótima, plota o % em relação ao ótimo conhecido
         if metrica == 'otimo_apt':
@@ -89,19 +88,19 @@ class Visualizador:
             ax.set_zticklabels([f'{x:.3g}%' for x in arange(60, 110, 10)])
 
         # Nomes dos eixos
-        plt.xlabel('n_pop')
-        plt.ylabel('tx_mut')
+        plt.xlabel(str(dados['param2']))
+        plt.ylabel(str(dados['param1']))
         
         surf = ax.plot_surface(x, y, z,
                                cmap='viridis',
                                edgecolor='none')
         plt.xticks(
-            ticks=arange(len(df.columns)),
-            labels=[f'{x:.3g}' for x in df.columns]
+            ticks=arange(len(eixo2)),
+            labels=[f'{x:.3g}' for x in eixo2]
         )
         plt.yticks(
-            ticks=arange(len(df.index)),
-            labels=[f'{x:.3g}' for x in df.index]
+            ticks=arange(len(eixo1)),
+            labels=[f'{x:.3g}' for x in eixo1]
         )
         # fig.colorbar(
         #     surf,
@@ -196,6 +195,16 @@ class Visualizador:
         plt.ylabel('Aptidão')
         plt.title('Desempenho do AG')
 
+    def diversidade(self,
+                    hamming: list,
+                    unicos: list) -> None:
+        plt.plot(hamming, label='Hamming médio')
+        plt.plot(unicos, label='Cromossomos únicos')
+
+        plt.xlabel('Geração')
+        plt.ylabel('Diversidade')
+        plt.title('Diversidade da população')
+
     def plot_linha(self,
                    data: list,
                    label: str) -> None:
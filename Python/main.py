@@ -9,7 +9,8 @@
 from json import load
 from pathlib import Path
 
-from algoritmogenetico import AlgoritmoGenetico
+from algoritmogenetico import (AlgoritmoGenetico, AvaliadorAssincrono,
+                               CacheResultados, ServidorLocal)
 
 # ---------------------------------------------------------------
 # MAIN
@@ -40,6 +41,22 @@ def main():
     ag = AlgoritmoGenetico(conf=conf)
     # -----------------------------------------------------
 
+    # Cache de resultados ---------------------------------
+    # ag.semente = 42
+    # ag.cache = CacheResultados(conf['result_dir']/'cache')
+    # -----------------------------------------------------
+
+    # Avaliação por serviço externo (servidor local) -------
+    # with ServidorLocal(falhas=2, lentas=2, atraso=1.0) as servidor:
+    #     with AvaliadorAssincrono(servidor.objetivo,
+    #                              tam_lote=8,
+    #                              timeout=0.5) as avaliador:
+    #         ag.avaliador_async = avaliador
+    #         ag.executa(plot=False)
+    #         print(avaliador.relatorio())
+    #     ag.avaliador_async = None
+    # -----------------------------------------------------
+
     # Testa -----------------------------------------------
     # ag.executa()
     # -----------------------------------------------------